@@ -12,10 +12,14 @@ Usage:
 
 import struct
 import zlib
+import binascii
 import argparse
 import os
 import csv
+from array import array
+from functools import lru_cache
 from io import StringIO
+from typing import Iterator
 
 # ============================================================
 #  Constants — must match LoRaAudioPacket.h
@@ -51,24 +55,59 @@ PKT_NAMES = {
     PKT_ACK:         "ACK",
 }
 
+# Precompiled wire formats (little-endian, packed — matches the ESP32 structs)
+_HDR   = struct.Struct('<BBBBHHBB')  # LoRaHeader         (10 bytes)
+_START = struct.Struct('<HBHHIH')    # AudioStartPayload  (13 bytes)
+_END   = struct.Struct('<HIB')       # AudioEndPayload    (7 bytes)
+
+_START_PAYLOAD_SIZE = _START.size  # 13
+_END_PAYLOAD_SIZE   = _END.size    # 7
+
 # ============================================================
 #  CRC Helpers  (match the Arduino implementations exactly)
 # ============================================================
 
+def _build_crc16_table() -> tuple:
+    """Precompute the CRC-16/CCITT-FALSE remainder for every byte value."""
+    table = []
+    for byte in range(256):
+        crc = byte << 8
+        for _ in range(8):
+            mask = -((crc >> 15) & 1)  # all ones when the top bit is set
+            crc  = ((crc << 1) ^ (0x1021 & mask)) & 0xFFFF
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC16_TABLE = _build_crc16_table()
+
+
 def crc16(data: bytes) -> int:
-    """CRC-16/CCITT-FALSE — matches the Arduino crc16() in LoRaAudioPacket.h"""
-    crc = 0xFFFF
+    """
+    CRC-16/CCITT-FALSE — matches the Arduino crc16() in LoRaAudioPacket.h
+
+    binascii.crc_hqx() is the same MSB-first 0x1021 CRC; seeding it with
+    0xFFFF gives CCITT-FALSE in a single C call.
+    """
+    return binascii.crc_hqx(data, 0xFFFF)
+
+
+def crc16_reference(data: bytes) -> int:
+    """Table-driven Python CRC-16/CCITT-FALSE, used to cross-check crc16()."""
+    crc   = 0xFFFF
+    table = _CRC16_TABLE
     for byte in data:
-        crc ^= byte << 8
-        for _ in range(8):
-            crc = (crc << 1) ^ 0x1021 if crc & 0x8000 else crc << 1
-        crc &= 0xFFFF
+        crc = ((crc << 8) & 0xFFFF) ^ table[(crc >> 8) ^ byte]
     return crc
 
 
 def crc32(data: bytes) -> int:
-    """CRC-32 — matches the Arduino crc32() in LoRaAudioPacket.h"""
-    return zlib.crc32(data) & 0xFFFFFFFF
+    """
+    CRC-32 — matches the Arduino crc32() in LoRaAudioPacket.h
+
+    zlib.crc32() already returns an unsigned 32-bit value on Python 3.
+    """
+    return zlib.crc32(data)
 
 
 # ============================================================
@@ -116,7 +155,7 @@ def build_header(pkt_type: int, src: int, dst: int, exp_id: int,
     """
     ver_type = make_ver_type(LORA_PROTOCOL_VERSION, pkt_type)
     sf_cr    = make_sf_cr(sf, cr)
-    return struct.pack('<BBBBHHBB',
+    return _HDR.pack(
         ver_type,
         src,
         dst,
@@ -141,7 +180,7 @@ def build_audio_start(total_frags: int, codec_id: int, sample_hz: int,
       [7-10] total_size   (uint32)
       [11-12] crc16       (uint16)
     """
-    return struct.pack('<HBHHIH',
+    return _START.pack(
         total_frags,
         codec_id,
         sample_hz,
@@ -160,7 +199,7 @@ def build_audio_end(frag_count: int, crc32_val: int) -> bytes:
       [2-5]  crc32       (uint32)
       [6]    reserved    (uint8)
     """
-    return struct.pack('<HIB',
+    return _END.pack(
         frag_count,
         crc32_val,
         0x00,
@@ -171,15 +210,24 @@ def build_audio_end(frag_count: int, crc32_val: int) -> bytes:
 #  Packet Parsing  (mirrors Arduino deserialize functions)
 # ============================================================
 
+def _lookup_name(names: dict, key: int) -> str:
+    """Look up a display name, only formatting the UNKNOWN(...) fallback on a miss."""
+    name = names.get(key)
+    if name is None:
+        name = f"UNKNOWN(0x{key:02X})"
+    return name
+
+
 def parse_header(data: bytes) -> dict:
     """Parse 10-byte header into a dict."""
-    if len(data) < LORA_HEADER_SIZE:
-        raise ValueError(f"Header too short: {len(data)} bytes (need {LORA_HEADER_SIZE})")
-    ver_type, src, dst, exp_id, session, seq, tx_pow, sf_cr = struct.unpack_from('<BBBBHHBB', data, 0)
+    if len(data) < _HDR.size:
+        raise ValueError(f"Header too short: {len(data)} bytes (need {_HDR.size})")
+    ver_type, src, dst, exp_id, session, seq, tx_pow, sf_cr = _HDR.unpack_from(data, 0)
+    pkt_type = get_type(ver_type)
     return {
         'version':    get_version(ver_type),
-        'type':       get_type(ver_type),
-        'type_name':  PKT_NAMES.get(get_type(ver_type), f"UNKNOWN(0x{get_type(ver_type):02X})"),
+        'type':       pkt_type,
+        'type_name':  _lookup_name(PKT_NAMES, pkt_type),
         'src_id':     src,
         'dst_id':     dst,
         'exp_id':     exp_id,
@@ -193,11 +241,11 @@ def parse_header(data: bytes) -> dict:
 
 def parse_audio_start(data: bytes) -> dict:
     """Parse AudioStartPayload from bytes after the header."""
-    total_frags, codec_id, sample_hz, duration_ms, total_size, crc16_val = struct.unpack_from('<HBHHIH', data, 0)
+    total_frags, codec_id, sample_hz, duration_ms, total_size, crc16_val = _START.unpack_from(data, 0)
     return {
         'total_frags':  total_frags,
         'codec_id':     codec_id,
-        'codec_name':   CODEC_NAMES.get(codec_id, f"UNKNOWN(0x{codec_id:02X})"),
+        'codec_name':   _lookup_name(CODEC_NAMES, codec_id),
         'sample_hz':    sample_hz,
         'duration_ms':  duration_ms,
         'total_size':   total_size,
@@ -207,7 +255,7 @@ def parse_audio_start(data: bytes) -> dict:
 
 def parse_audio_end(data: bytes) -> dict:
     """Parse AudioEndPayload from bytes after the header."""
-    frag_count, crc32_val, reserved = struct.unpack_from('<HIB', data, 0)
+    frag_count, crc32_val, reserved = _END.unpack_from(data, 0)
     return {
         'frag_count': frag_count,
         'crc32':      crc32_val,
@@ -219,43 +267,87 @@ def parse_audio_end(data: bytes) -> dict:
 #  Packet Simulation  (full sender simulation)
 # ============================================================
 
-def simulate_transfer(audio_data: bytes, codec_id: int = CODEC_RAW_PCM,
-                      sample_hz: int = 16000, duration_ms: int = 1000,
-                      exp_id: int = 1, session_id: int = 0x0042,
-                      src: int = 0x01, dst: int = 0x02,
-                      tx_pow: int = 14, sf: int = 7, cr: int = 5) -> list[bytes]:
+def simulate_transfer_stream(audio_data: bytes, codec_id: int = CODEC_RAW_PCM,
+                             sample_hz: int = 16000, duration_ms: int = 1000,
+                             exp_id: int = 1, session_id: int = 0x0042,
+                             src: int = 0x01, dst: int = 0x02,
+                             tx_pow: int = 14, sf: int = 7, cr: int = 5) -> tuple[bytes, array]:
     """
-    Simulate the full sender packet sequence for a given audio buffer.
-    Returns a list of raw packet byte strings in transmission order.
+    Simulate the full sender packet sequence into one contiguous buffer.
+    Returns (buf, offsets) where packet i is buf[offsets[i]:offsets[i + 1]],
+    in transmission order. Use packets_view() to walk the packets.
     """
     total_size  = len(audio_data)
     total_frags = (total_size + LORA_MAX_DATA_PAYLOAD - 1) // LORA_MAX_DATA_PAYLOAD
     c16         = crc16(audio_data)
     c32         = crc32(audio_data)
 
-    packets = []
+    # Every header field except ver_type and seq_num is constant for the
+    # whole transfer, so resolve them once and pack headers in place.
+    sf_cr         = make_sf_cr(sf, cr)
+    pack_hdr_into = _HDR.pack_into
+    audio_view    = memoryview(audio_data)
+
+    buf = bytearray(
+        LORA_HEADER_SIZE + _START_PAYLOAD_SIZE
+        + total_frags * LORA_HEADER_SIZE + total_size
+        + LORA_HEADER_SIZE + _END_PAYLOAD_SIZE
+    )
+    offsets = array('I', [0])
 
     # --- START packet ---
-    hdr     = build_header(PKT_AUDIO_START, src, dst, exp_id, session_id, 0, tx_pow, sf, cr)
-    payload = build_audio_start(total_frags, codec_id, sample_hz, duration_ms, total_size, c16)
-    packets.append(hdr + payload)
+    pack_hdr_into(buf, 0, make_ver_type(LORA_PROTOCOL_VERSION, PKT_AUDIO_START),
+                  src, dst, exp_id, session_id, 0, tx_pow, sf_cr)
+    _START.pack_into(buf, LORA_HEADER_SIZE,
+                     total_frags, codec_id, sample_hz, duration_ms, total_size, c16)
+    pos = LORA_HEADER_SIZE + _START_PAYLOAD_SIZE
+    offsets.append(pos)
 
     # --- DATA packets ---
+    data_ver_type = make_ver_type(LORA_PROTOCOL_VERSION, PKT_AUDIO_DATA)
     seq    = 0
     offset = 0
     while offset < total_size:
-        chunk     = audio_data[offset : offset + LORA_MAX_DATA_PAYLOAD]
-        hdr       = build_header(PKT_AUDIO_DATA, src, dst, exp_id, session_id, seq, tx_pow, sf, cr)
-        packets.append(hdr + chunk)
-        offset   += len(chunk)
-        seq      += 1
+        chunk_len = min(LORA_MAX_DATA_PAYLOAD, total_size - offset)
+        pack_hdr_into(buf, pos, data_ver_type, src, dst, exp_id, session_id, seq, tx_pow, sf_cr)
+        pos += LORA_HEADER_SIZE
+        buf[pos : pos + chunk_len] = audio_view[offset : offset + chunk_len]
+        pos    += chunk_len
+        offset += chunk_len
+        seq    += 1
+        offsets.append(pos)
 
     # --- END packet ---
-    hdr     = build_header(PKT_AUDIO_END, src, dst, exp_id, session_id, seq, tx_pow, sf, cr)
-    payload = build_audio_end(seq, c32)
-    packets.append(hdr + payload)
+    pack_hdr_into(buf, pos, make_ver_type(LORA_PROTOCOL_VERSION, PKT_AUDIO_END),
+                  src, dst, exp_id, session_id, seq, tx_pow, sf_cr)
+    _END.pack_into(buf, pos + LORA_HEADER_SIZE, seq, c32, 0x00)
+    offsets.append(pos + LORA_HEADER_SIZE + _END_PAYLOAD_SIZE)
+
+    return bytes(buf), offsets
+
+
+def packets_view(buf: bytes, offsets: array) -> Iterator[memoryview]:
+    """Yield a zero-copy view of each packet in a simulate_transfer_stream() buffer."""
+    view = memoryview(buf)
+    for start, end in zip(offsets, offsets[1:]):
+        yield view[start:end]
+
 
-    return packets
+def simulate_transfer(audio_data: bytes, codec_id: int = CODEC_RAW_PCM,
+                      sample_hz: int = 16000, duration_ms: int = 1000,
+                      exp_id: int = 1, session_id: int = 0x0042,
+                      src: int = 0x01, dst: int = 0x02,
+                      tx_pow: int = 14, sf: int = 7, cr: int = 5) -> list[bytes]:
+    """
+    Simulate the full sender packet sequence for a given audio buffer.
+    Returns a list of raw packet byte strings in transmission order.
+    """
+    buf, offsets = simulate_transfer_stream(
+        audio_data, codec_id=codec_id, sample_hz=sample_hz, duration_ms=duration_ms,
+        exp_id=exp_id, session_id=session_id, src=src, dst=dst,
+        tx_pow=tx_pow, sf=sf, cr=cr,
+    )
+    return [bytes(pkt) for pkt in packets_view(buf, offsets)]
 
 
 # ============================================================
@@ -263,13 +355,21 @@ def simulate_transfer(audio_data: bytes, codec_id: int = CODEC_RAW_PCM,
 #  Based on Semtech SX1262 LoRa airtime formula
 # ============================================================
 
+@lru_cache(maxsize=None)
+def _symbol_time_ms(sf: int, bw_khz: float) -> float:
+    """LoRa symbol duration in milliseconds for a given SF/bandwidth."""
+    bw_hz = bw_khz * 1000
+    return (2 ** sf) / bw_hz * 1000
+
+
+@lru_cache(maxsize=None)
 def estimate_airtime_ms(payload_bytes: int, sf: int, bw_khz: float = 125.0, cr: int = 5) -> float:
     """
     Estimate LoRa packet airtime in milliseconds.
     Assumes explicit header mode, low data rate optimisation auto.
+    Results are memoized — the radio parameters only take a few values.
     """
-    bw_hz       = bw_khz * 1000
-    t_sym       = (2 ** sf) / bw_hz * 1000  # ms per symbol
+    t_sym       = _symbol_time_ms(sf, bw_khz)  # ms per symbol
     preamble    = 8                           # standard preamble length
     t_preamble  = (preamble + 4.25) * t_sym
 
@@ -289,9 +389,9 @@ def estimate_airtime_ms(payload_bytes: int, sf: int, bw_khz: float = 125.0, cr:
 def estimate_transfer_stats(audio_bytes: int, sf: int, bw_khz: float = 125.0, cr: int = 5) -> dict:
     """Estimate total airtime and throughput for a full audio transfer."""
     total_frags  = (audio_bytes + LORA_MAX_DATA_PAYLOAD - 1) // LORA_MAX_DATA_PAYLOAD
-    start_pkt_sz = LORA_HEADER_SIZE + struct.calcsize('<HBHHIh')
+    start_pkt_sz = LORA_HEADER_SIZE + _START_PAYLOAD_SIZE
     data_pkt_sz  = LORA_HEADER_SIZE + LORA_MAX_DATA_PAYLOAD
-    end_pkt_sz   = LORA_HEADER_SIZE + struct.calcsize('<HIB')
+    end_pkt_sz   = LORA_HEADER_SIZE + _END_PAYLOAD_SIZE
 
     airtime_start = estimate_airtime_ms(start_pkt_sz, sf, bw_khz, cr)
     airtime_data  = estimate_airtime_ms(data_pkt_sz, sf, bw_khz, cr) * total_frags
@@ -312,13 +412,29 @@ def estimate_transfer_stats(audio_bytes: int, sf: int, bw_khz: float = 125.0, cr
 #  Dummy Audio Generators
 # ============================================================
 
+_RAMP = bytes(range(256))
+_RAMP_CACHE = {}
+
+
+def _ramp_bytes(size_bytes: int) -> bytes:
+    """
+    Return size_bytes of the 0x00..0xFF ramp, built by tiling _RAMP.
+    The result is immutable, so each size is built once and reused.
+    """
+    buf = _RAMP_CACHE.get(size_bytes)
+    if buf is None:
+        buf = (_RAMP * ((size_bytes + 255) // 256))[:size_bytes]
+        _RAMP_CACHE[size_bytes] = buf
+    return buf
+
+
 def generate_dummy_pcm(size_bytes: int = 32000) -> bytes:
     """
     Generate dummy raw PCM data.
     Uses a simple ramp pattern (0x00..0xFF repeating) — easy to spot
     corruption or misalignment when inspecting hex output.
     """
-    return bytes(i % 256 for i in range(size_bytes))
+    return _ramp_bytes(size_bytes)
 
 
 def generate_dummy_compressed(size_bytes: int = 3200) -> bytes:
@@ -326,7 +442,7 @@ def generate_dummy_compressed(size_bytes: int = 3200) -> bytes:
     Generate dummy 'compressed' data — same ramp pattern but 10x smaller,
     simulating ~10:1 compression ratio for the comparison experiment.
     """
-    return bytes(i % 256 for i in range(size_bytes))
+    return _ramp_bytes(size_bytes)
 
 
 # ============================================================
@@ -345,16 +461,20 @@ def parse_rx_log(log_text: str) -> dict:
     sessions = {}
     fragments = []
 
-    for line in log_text.strip().splitlines():
-        line = line.strip()
-        if not line or line.startswith('#'):
-            continue
+    # Quotes carry no meaning in the Serial output: QUOTE_NONE keeps a stray
+    # '"' on one line from swallowing the lines after it (like str.split).
+    # Lines are not stripped: splitlines() already removes the Serial
+    # Monitor's CR/LF and int()/float() tolerate surrounding whitespace, so
+    # only the fields compared as strings (record type, crc_ok, duration)
+    # are stripped.
+    rows = csv.reader((line for line in log_text.splitlines() if line and line[0] != '#'),
+                      quoting=csv.QUOTE_NONE)
 
-        parts = line.split(',')
-        record_type = parts[0]
+    for parts in rows:
+        record_type = parts[0].strip()
 
         if record_type == 'SESSION_START' and len(parts) >= 8:
-            sid = parts[2]
+            sid = int(parts[2])
             sessions[sid] = {
                 'exp_id':      int(parts[1]),
                 'session_id':  sid,
@@ -369,7 +489,7 @@ def parse_rx_log(log_text: str) -> dict:
             }
 
         elif record_type == 'RX' and len(parts) >= 8:
-            sid = parts[2]
+            sid = int(parts[2])
             frag = {
                 'exp_id':     int(parts[1]),
                 'session_id': sid,
@@ -380,24 +500,38 @@ def parse_rx_log(log_text: str) -> dict:
                 'timestamp':  int(parts[7]),
             }
             fragments.append(frag)
-            if sid in sessions:
-                sessions[sid]['fragments'].append(frag)
-                sessions[sid]['rssi_values'].append(frag['rssi'])
-                sessions[sid]['snr_values'].append(frag['snr'])
+            session = sessions.get(sid)
+            if session is not None:
+                session['fragments'].append(frag)
+                session['rssi_values'].append(frag['rssi'])
+                session['snr_values'].append(frag['snr'])
 
         elif record_type == 'SESSION_END' and len(parts) >= 7:
-            sid = parts[2]
-            if sid in sessions:
-                sessions[sid]['frags_received'] = int(parts[3])
-                sessions[sid]['frags_expected'] = int(parts[4])
-                sessions[sid]['crc_ok']         = parts[5] == '1'
-                duration_raw = parts[6]
-                sessions[sid]['duration_ms']    = int(duration_raw) if duration_raw.isdigit() else None
-                sessions[sid]['timed_out']      = duration_raw == 'TIMEOUT'
+            session = sessions.get(int(parts[2]))
+            if session is not None:
+                session['frags_received'] = int(parts[3])
+                session['frags_expected'] = int(parts[4])
+                session['crc_ok']         = parts[5].strip() == '1'
+                duration_raw = parts[6].strip()
+                session['duration_ms']    = int(duration_raw) if duration_raw.isdigit() else None
+                session['timed_out']      = duration_raw == 'TIMEOUT'
 
     return sessions
 
 
+def _min_max_avg(values: list) -> tuple:
+    """Return (min, max, mean) of a non-empty list in a single pass."""
+    lo = hi = values[0]
+    total = 0.0
+    for v in values:
+        total += v
+        if v < lo:
+            lo = v
+        elif v > hi:
+            hi = v
+    return lo, hi, total / len(values)
+
+
 def print_session_report(sessions: dict):
     """Print a human-readable analysis of parsed receiver sessions."""
     if not sessions:
@@ -430,9 +564,11 @@ def print_session_report(sessions: dict):
         if s.get('duration_ms'):
             print(f"  Duration     : {s['duration_ms']} ms")
         if rssi_list:
-            print(f"  RSSI         : min={min(rssi_list):.1f}  max={max(rssi_list):.1f}  avg={sum(rssi_list)/len(rssi_list):.1f} dBm")
+            lo, hi, avg = _min_max_avg(rssi_list)
+            print(f"  RSSI         : min={lo:.1f}  max={hi:.1f}  avg={avg:.1f} dBm")
         if snr_list:
-            print(f"  SNR          : min={min(snr_list):.1f}  max={max(snr_list):.1f}  avg={sum(snr_list)/len(snr_list):.1f} dB")
+            lo, hi, avg = _min_max_avg(snr_list)
+            print(f"  SNR          : min={lo:.1f}  max={hi:.1f}  avg={avg:.1f} dB")
         print(f"{'='*50}")
 
 
@@ -457,6 +593,17 @@ def test_crc():
     # Verify same data gives same CRC
     assert crc16(data) == c16, "CRC-16 should be deterministic"
     assert crc32(data) == c32, "CRC-32 should be deterministic"
+
+    # Verify the standard check values — the Arduino crc16()/crc32() loops
+    # produce these, so a match here means byte-identical CRCs on both sides
+    assert crc16(b"123456789") == 0x29B1, "CRC-16 check value mismatch"
+    assert crc16(b"") == 0xFFFF, "CRC-16 of empty data should be the initial value"
+    assert crc32(b"123456789") == 0xCBF43926, "CRC-32 check value mismatch"
+
+    # Verify the C-backed crc16() agrees with the Python reference
+    ramp = bytes(range(256)) * 4
+    for n in (0, 1, 9, 10, 255, len(ramp)):
+        assert crc16(ramp[:n]) == crc16_reference(ramp[:n]), f"CRC-16 mismatch at {n} bytes"
     print("  PASS")
 
 
@@ -474,6 +621,7 @@ def test_header_pack_unpack():
 
     print(f"  Raw bytes ({len(raw)}): {' '.join(f'{b:02X}' for b in raw)}")
     assert len(raw) == LORA_HEADER_SIZE, f"Header should be {LORA_HEADER_SIZE} bytes"
+    assert raw == bytes.fromhex("11 01 02 03 CD AB 2A 00 0E 97"), "Header bytes differ from the packed C struct"
 
     hdr = parse_header(raw)
     print(f"  Parsed   : {hdr}")
@@ -532,11 +680,12 @@ def test_full_simulation_raw():
     assert start_payload['codec_name'] == "Raw PCM"
     print(f"  START: {start_payload}")
 
-    # Verify DATA packets
-    for i, pkt in enumerate(packets[1:-1]):
-        hdr = parse_header(pkt)
-        assert hdr['type']    == PKT_AUDIO_DATA
-        assert hdr['seq_num'] == i
+    # Verify DATA packets — unpack every header in one pass, then check by column
+    data_pkts = packets[1:-1]
+    headers   = b''.join(pkt[:LORA_HEADER_SIZE] for pkt in data_pkts)
+    rows      = list(_HDR.iter_unpack(headers))
+    assert {get_type(r[0]) for r in rows} <= {PKT_AUDIO_DATA}, "Non-DATA packet in DATA range"
+    assert [r[5] for r in rows] == list(range(len(data_pkts))), "DATA seq_num out of order"
 
     # Verify END
     end_hdr     = parse_header(packets[-1])
@@ -544,9 +693,16 @@ def test_full_simulation_raw():
     assert end_hdr['type'] == PKT_AUDIO_END
     print(f"  END: {end_payload}")
 
-    # Verify reassembly — strip headers and stitch data back together
-    reassembled = b''.join(pkt[LORA_HEADER_SIZE:] for pkt in packets[1:-1])
-    reassembled = reassembled[:len(dummy)]  # trim any padding on last fragment
+    # Verify reassembly — strip headers and copy each payload into place
+    total_size  = start_payload['total_size']
+    reassembled = bytearray(total_size)
+    offset      = 0
+    for pkt in packets[1:-1]:
+        chunk = memoryview(pkt)[LORA_HEADER_SIZE:]
+        n     = min(len(chunk), total_size - offset)  # ignore any padding on last fragment
+        reassembled[offset : offset + n] = chunk[:n]
+        offset += n
+    assert offset == len(dummy), "Reassembled size does not match original"
     assert crc32(reassembled) == end_payload['crc32'], "CRC32 mismatch after reassembly"
     assert reassembled == dummy, "Reassembled data does not match original"
     print("  Reassembly CRC32: PASS")
@@ -558,15 +714,20 @@ def test_full_simulation_compressed():
     dummy_raw  = generate_dummy_pcm(32000)
     dummy_comp = generate_dummy_compressed(3200)
 
-    raw_packets  = simulate_transfer(dummy_raw,  codec_id=CODEC_RAW_PCM)
-    comp_packets = simulate_transfer(dummy_comp, codec_id=CODEC_COMPRESSED)
+    raw_buf,  raw_offsets  = simulate_transfer_stream(dummy_raw,  codec_id=CODEC_RAW_PCM)
+    comp_buf, comp_offsets = simulate_transfer_stream(dummy_comp, codec_id=CODEC_COMPRESSED)
 
-    raw_total_bytes  = sum(len(p) for p in raw_packets)
-    comp_total_bytes = sum(len(p) for p in comp_packets)
+    # The stream is packed back-to-back, so its length is the over-the-air total
+    raw_total_bytes  = len(raw_buf)
+    comp_total_bytes = len(comp_buf)
     reduction        = (1 - comp_total_bytes / raw_total_bytes) * 100
 
-    print(f"  Raw  : {len(raw_packets)} packets, {raw_total_bytes} bytes over the air")
-    print(f"  Comp : {len(comp_packets)} packets, {comp_total_bytes} bytes over the air")
+    # The stream and list forms must describe the same packets
+    assert [bytes(p) for p in packets_view(comp_buf, comp_offsets)] == \
+        simulate_transfer(dummy_comp, codec_id=CODEC_COMPRESSED), "Stream/list packet mismatch"
+
+    print(f"  Raw  : {len(raw_offsets) - 1} packets, {raw_total_bytes} bytes over the air")
+    print(f"  Comp : {len(comp_offsets) - 1} packets, {comp_total_bytes} bytes over the air")
     print(f"  Reduction : {reduction:.1f}%")
     print("  PASS")
 
@@ -586,6 +747,31 @@ def test_airtime_comparison():
         print(f"    Saving    : {saving:.2f}s  ({(saving/raw_stats['airtime_s']*100):.0f}% less airtime)")
 
 
+# Byte offset -> field label for the START packet hex dump
+START_PKT_LABELS = {
+    0:  " ← ver_type",
+    1:  " ← src_id",
+    2:  " ← dst_id",
+    3:  " ← exp_id",
+    4:  " ← session_id (low byte)",
+    5:  " ← session_id (high byte)",
+    6:  " ← seq_num (low byte)",
+    7:  " ← seq_num (high byte)",
+    8:  " ← tx_pow",
+    9:  " ← sf_cr",
+    10: " ← total_frags (low byte)",
+    11: " ← total_frags (high byte)",
+    12: " ← codec_id",
+    13: " ← sample_hz (low byte)",
+    14: " ← sample_hz (high byte)",
+    15: " ← duration_ms (low byte)",
+    16: " ← duration_ms (high byte)",
+    **{i: f" ← total_size byte {i - 17}" for i in range(17, 21)},
+    21: " ← crc16 (low byte)",
+    22: " ← crc16 (high byte)",
+}
+
+
 def test_byte_layout_printout():
     print("\n--- Test: Byte Layout Printout ---")
     dummy = generate_dummy_pcm(500)
@@ -594,30 +780,53 @@ def test_byte_layout_printout():
     print(f"\n  START packet hex:")
     p = packets[0]
     for i, b in enumerate(p):
-        label = ""
-        if i == 0:  label = " ← ver_type"
-        if i == 1:  label = " ← src_id"
-        if i == 2:  label = " ← dst_id"
-        if i == 3:  label = " ← exp_id"
-        if i == 4:  label = " ← session_id (low byte)"
-        if i == 5:  label = " ← session_id (high byte)"
-        if i == 6:  label = " ← seq_num (low byte)"
-        if i == 7:  label = " ← seq_num (high byte)"
-        if i == 8:  label = " ← tx_pow"
-        if i == 9:  label = " ← sf_cr"
-        if i == 10: label = " ← total_frags (low byte)"
-        if i == 11: label = " ← total_frags (high byte)"
-        if i == 12: label = " ← codec_id"
-        if i == 13: label = " ← sample_hz (low byte)"
-        if i == 14: label = " ← sample_hz (high byte)"
-        if i == 15: label = " ← duration_ms (low byte)"
-        if i == 16: label = " ← duration_ms (high byte)"
-        if i in (17,18,19,20): label = f" ← total_size byte {i-17}"
-        if i == 21: label = " ← crc16 (low byte)"
-        if i == 22: label = " ← crc16 (high byte)"
+        label = START_PKT_LABELS.get(i, "")
         print(f"    [{i:02d}]  0x{b:02X}  ({b:>3}){label}")
 
 
+def test_parse_rx_log():
+    print("\n--- Test: Receiver Log Parsing ---")
+    log_text = "\r\n".join([
+        "# receiver log — comment line",
+        "SESSION_START,1,66,3,0,16000,1000,700",
+        "RX,1,66,0,-70.5,9.25,255,1000",
+        "INFO,\"boot",                        # stray quote must not eat the next lines
+        "RX,1,66,1,-72.0,8.0,255,1100",
+        "",
+        "  RX,1,66,2,-69.0,7.5,210,1200",     # indented record
+        "SESSION_END,1,66,3,3,1,1234",
+        "  SESSION_START,2,67,2,1,16000,1000,400",
+        "RX,2,67,0,-80,3,255,2000",
+        "SESSION_END,2,67,1,2,0,TIMEOUT",
+    ]) + "\r\n"
+
+    sessions = parse_rx_log(log_text)
+    print(f"  Sessions : {sorted(sessions)}")
+    assert sorted(sessions) == [66, 67], "Session ids should be int keys"
+
+    s66, s67 = sessions[66], sessions[67]
+    assert s66['session_id'] == 66
+    assert len(s66['fragments']) == 3, "Session 66 should keep all 3 fragments"
+    assert [f['seq'] for f in s66['fragments']] == [0, 1, 2]
+    assert s66['frags_received'] == 3 and s66['frags_expected'] == 3
+    assert s66['crc_ok'] is True
+    assert s66['duration_ms'] == 1234
+    assert s66['timed_out'] is False
+
+    assert len(s67['fragments']) == 1, "Session 67 should keep its fragment"
+    assert s67['codec'] == CODEC_COMPRESSED
+    assert s67['crc_ok'] is False
+    assert s67['duration_ms'] is None
+    assert s67['timed_out'] is True
+
+    # Single-pass stats must match the builtin reductions
+    for values in (s66['rssi_values'], s66['snr_values'], s67['rssi_values']):
+        lo, hi, avg = _min_max_avg(values)
+        assert (lo, hi) == (min(values), max(values)), "min/max mismatch"
+        assert abs(avg - sum(values) / len(values)) < 1e-9, "mean mismatch"
+    print("  PASS")
+
+
 # ============================================================
 #  Main
 # ============================================================
@@ -634,6 +843,7 @@ def run_all_tests():
     test_full_simulation_compressed()
     test_airtime_comparison()
     test_byte_layout_printout()
+    test_parse_rx_log()
 
     print("\n" + "=" * 50)
     print("  All tests passed.")